@@ -3,7 +3,7 @@
 """Maze generator and solver with curses.
 
 This module provides an interactive terminal maze application that
-supports two algorithms (DFS and PRIME), BFS solving, and animated
+supports three algorithms (DFS, PRIME and KRUSKAL), BFS solving, and animated
 solution path display.
 
 Typical usage:
@@ -19,22 +19,40 @@ Enjoy playing the maze.
 import curses
 import random
 import sys
+from typing import Any, Dict
 from hexa_output import create_output_file
 from mazegen.mazegen import MazeGenerator
 from parse_config_file import parse_config
 
 
-def main(stdscr: curses.window) -> None:
+def draw_menu(stdscr: curses.window, height: int) -> None:
+    """Write the menu below the maze.
+
+    The menu never changes, so it is only written once and again after
+    the screen has been cleared.
+
+    Args:
+        stdscr: Curses window object for display.
+        height: Height of the maze in cells.
+    """
+    stdscr.addstr(height * 2 + 2, 0, "===========A_MAZ_ING========")
+    stdscr.addstr(height * 2 + 3, 0, "1. Re-generate a new maze")
+    stdscr.addstr(height * 2 + 4, 0, "2. Show/Hide solution")
+    stdscr.addstr(height * 2 + 5, 0, "3. Change maze's colors")
+    stdscr.addstr(height * 2 + 6, 0, "4. Quit")
+    stdscr.refresh()
+
+
+def main(stdscr: curses.window, conf: Dict[str, Any]) -> None:
     """Main function to initialize and run the maze generation.
     Initializes curses color pairs, creates a maze instance, displays it,
     and runs the depth-first search algorithm to generate the maze paths.
     Waits for user input before exiting.
     Args:
         stdscr: Curses window object provided by curses.wrapper.
+        conf: Configuration returned by parse_config.
     """
 
-    file = sys.argv
-    conf = parse_config(file[1])
     entry = conf["entry"]
     exit_point = conf["exit"]
     height = conf["height"]
@@ -45,6 +63,9 @@ def main(stdscr: curses.window) -> None:
     output_file = conf["output_file"]
 
     curses.curs_set(0)
+    # The cursor is hidden, so let curses leave it wherever the last write
+    # ended instead of moving it back on every refresh.
+    stdscr.leaveok(True)
 
     curses.init_pair(1, curses.COLOR_BLUE, curses.COLOR_BLACK)
     curses.init_pair(2, curses.COLOR_CYAN, curses.COLOR_BLACK)
@@ -70,75 +91,57 @@ def main(stdscr: curses.window) -> None:
     solution = None
     show_solution = True
     stdscr.clear()
-    maze = MazeGenerator(height, width, entry, exit_point, perfect, maze_color)
-    exit_x = exit_point[1]
-    exit_y = exit_point[0]
-    entry_x = entry[1]
-    entry_y = entry[0]
-    if maze.cells[exit_y][exit_x].logo:
-        raise ValueError("Exit have the same coordinates!")
-    if maze.cells[entry_y][entry_x].logo:
-        raise ValueError("Ba3ad entry mn logo please!")
+    maze = MazeGenerator(height, width, entry, exit_point, perfect, maze_color,
+                         seed)
+    color_rng = random.Random()
+    draw_menu(stdscr, height)
 
-    stdscr.addstr(height * 2 + 2, 0, "===========A_MAZ_ING========")
-    stdscr.addstr(height * 2 + 3, 0, "1. Re-generate a new maze")
-    stdscr.addstr(height * 2 + 4, 0, "2. Show/Hide solution")
-    stdscr.addstr(height * 2 + 5, 0, "3. Change maze's colors")
-    stdscr.addstr(height * 2 + 6, 0, "4. Quit")
-    stdscr.refresh()
-
-    if seed is not None:
-        random.seed(seed)
     if (algo == "DFS"):
         maze.dfs(stdscr, entry[0], entry[1])
     elif (algo == "PRIME"):
         maze.prime(stdscr, entry[0], entry[1])
+    elif (algo == "KRUSKAL"):
+        maze.kruskal(stdscr)
 
     solution = maze.bfs_solver(entry, exit_point)
     create_output_file(output_file, maze.cells, entry, exit_point, solution)
 
     while True:
-        stdscr.addstr(height * 2 + 2, 0, "===========A_MAZ_ING========")
-        stdscr.addstr(height * 2 + 3, 0, "1. Re-generate a new maze")
-        stdscr.addstr(height * 2 + 4, 0, "2. Show/Hide solution")
-        stdscr.addstr(height * 2 + 5, 0, "3. Change maze's colors")
-        stdscr.addstr(height * 2 + 6, 0, "4. Quit")
-        stdscr.refresh()
-
         try:
             choice = stdscr.getch()
             if choice == ord('1'):
-                if seed is not None:
-                    random.seed(seed)
                 maze = MazeGenerator(height, width, entry, exit_point,
-                                     perfect, maze_color)
+                                     perfect, maze_color, seed)
                 if (algo == "DFS"):
                     maze.dfs(stdscr, entry[0], entry[1])
                 elif (algo == "PRIME"):
                     maze.prime(stdscr, entry[0], entry[1])
+                elif (algo == "KRUSKAL"):
+                    maze.kruskal(stdscr)
+                # Only a new maze changes the solution and the output file.
+                solution = maze.bfs_solver(entry, exit_point)
+                create_output_file(output_file, maze.cells, entry,
+                                   exit_point, solution)
 
             elif choice == ord('2'):
-                solution = maze.bfs_solver(entry, exit_point)
                 if solution:
                     maze.show_hide_solution_path(stdscr, solution,
                                                  show_solution)
                     show_solution = not show_solution
 
             elif choice == ord('3'):
-                rndm = random.randint(1, 6)
+                rndm = color_rng.randrange(1, 7)
                 maze_color = maze_colors[str(rndm)]
                 maze.maze_color = maze_color
                 maze.display(stdscr)
 
             elif choice == ord('4'):
                 break
-            solution = maze.bfs_solver(entry, exit_point)
-            create_output_file(output_file, maze.cells, entry,
-                               exit_point, solution)
         except Exception as e:
             stdscr.refresh()
             stdscr.clear()
             print(f"They said somthing wrong.{str(e)}")
+            draw_menu(stdscr, height)
 
 
 if __name__ == "__main__":
@@ -146,7 +149,7 @@ if __name__ == "__main__":
         if (len(sys.argv) > 1):
             file = sys.argv
             conf = parse_config(file[len(file) - 1])
-            curses.wrapper(main)
+            curses.wrapper(main, conf)
         else:
             print("Error: Config file is missing!")
     except KeyboardInterrupt:
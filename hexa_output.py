@@ -3,11 +3,18 @@
 Exports the maze structure and solution path to a file using a hex encoding.
 Each cell maps to one hex character via the bitmask: T=1, R=2, B=4, L=8.
 """
+from itertools import chain, pairwise
 from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
     from mazegen.mazegen import Cell
 
+# Hex digit of every wall bitmask.
+HEX_DIGITS = "0123456789ABCDEF"
+
+# Letter written for each (row step, column step) of the solution path.
+MOVES = {(-1, 0): "N", (1, 0): "S", (0, 1): "E", (0, -1): "W"}
+
 
 def create_output_file(
         file: str,
@@ -19,8 +26,8 @@ def create_output_file(
     """Export the maze structure and solution path to a file.
 
     The maze grid is encoded using a hexadecimal representation where each
-    cell is represented by a single hex digit corresponding to its wall
-    configuration using the following bitmask:
+    cell is represented by a single hex digit: its wall bitmask, which
+    already uses the following layout:
 
         Top    = 1
         Right  = 2
@@ -44,41 +51,15 @@ def create_output_file(
     Returns:
         None
     """
-    total = 0
-    hexa = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
-            'A', 'B', 'C', 'D', 'E', 'F']
+    grid = "".join("".join([HEX_DIGITS[cell.walls] for cell in row]) + "\n"
+                   for row in cells)
     with open(file, "w") as f:
-        for row in cells:
-            for cell in row:
-                total = 0
-                if cell.walls['T']:
-                    total += 1
-                if cell.walls['R']:
-                    total += 2
-                if cell.walls['B']:
-                    total += 4
-                if cell.walls['L']:
-                    total += 8
-                f.write(hexa[total])
-            f.write('\n')
+        f.write(grid)
 
         f.write(f"\n{entry[1]},{entry[0]}\n")
         f.write(f"{exit[1]},{exit[0]}\n")
 
         if solution is not None:
-            x = entry[1]
-            y = entry[0]
-            for cel in solution:
-                nx = cel[1]
-                ny = cel[0]
-                if nx - x > 0:
-                    f.write('E')
-                elif nx - x < 0:
-                    f.write('W')
-                elif ny - y > 0:
-                    f.write('S')
-                elif ny - y < 0:
-                    f.write('N')
-                x = nx
-                y = ny
-            f.write('\n')
+            steps = pairwise(chain([entry], solution))
+            f.write("".join(MOVES.get((ny - y, nx - x), "")
+                            for (y, x), (ny, nx) in steps) + "\n")
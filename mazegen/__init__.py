@@ -8,4 +8,4 @@ from .mazegen import MazeGenerator
 
 __all__ = ["MazeGenerator"]
 __author__ = "zhaouzan, abchahid"
-__version__ = "0.1.0"
+__version__ = "0.2.0"
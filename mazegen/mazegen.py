@@ -3,8 +3,8 @@
 """Maze generator and solver with curses.
 
 This module provides an interactive terminal maze application that
-supports two algorithms (DFS and PRIME), BFS solving, and animated
-solution path display.
+supports three algorithms (DFS, Prim's and Kruskal's), BFS solving, and
+animated solution path display.
 
 Typical usage:
 
@@ -17,40 +17,95 @@ Engoy playing the maze.
 
 
 import curses
-import math
+import itertools
 import random
 import time
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Sequence, Set, Tuple
+
+# Wall bits, same layout as the hex digits of the output file.
+#
+# Wall invariant: a wall is always carved on both of its sides together,
+# and the walls on the maze border are never carved. An open side therefore
+# always leads to a cell inside the grid whose matching wall is open too,
+# which is why the drawing, solving and neighbour code does no bounds or
+# neighbour-wall checks.
+T = 1
+R = 2
+B = 4
+L = 8
+ALL_WALLS = T | R | B | L
+
+# Animation pacing: each animated step is given STEP_TIME seconds, but a
+# whole animation never lasts longer than ANIMATION_TIME, and the terminal
+# is updated at most once every FRAME_TIME.
+STEP_TIME = 0.01
+ANIMATION_TIME = 5.0
+FRAME_TIME = 1 / 60
+
+# (row step, column step, wall crossed) in the order neighbours are explored.
+DIRECTIONS = ((0, 1, R), (1, 0, B), (0, -1, L), (-1, 0, T))
+
+# Every ordering of DIRECTIONS, so a random neighbour order is one pick.
+DIRECTION_ORDERS = tuple(itertools.permutations(DIRECTIONS))
+
+# Order in which Prim's algorithm looks for a visited neighbour to join.
+JOIN_ORDER = ((-1, 0, T), (0, -1, L), (0, 1, R), (1, 0, B))
+
+# The same wall seen from the cell on the other side.
+OPPOSITE = {T: B, R: L, B: T, L: R}
+
+# (row, column) of the "42" logo cells, relative to its top-left corner.
+LOGO_OFFSETS = (
+    (0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (3, 2), (4, 2),
+    (4, 4), (4, 5), (4, 6), (3, 4), (2, 4), (2, 5), (2, 6),
+    (1, 6), (0, 6), (0, 5), (0, 4),
+)
+
+# Screen text with its curses attribute, written left to right.
+Segments = Sequence[Tuple[str, int]]
+
+# Top, middle and bottom text of a cell block for every wall bitmask, used
+# for cells drawn entirely in the wall color.
+WALL_ROWS = tuple(
+    ("█" + ("██" if walls & T else "  ") + "█",
+     ("█" if walls & L else " ") + "  " + ("█" if walls & R else " "),
+     "█" + ("██" if walls & B else "  ") + "█")
+    for walls in range(ALL_WALLS + 1)
+)
 
 
 class Cell:
     """Represents a single cell in the maze grid.
 
     Attributes:
-        walls: Dictionary indicating presence of walls on each side
-               (keys: 'T', 'B', 'L', 'R' for top, bottom, left, right).
-        limits: Dictionary indicating if cell is at maze boundaries
-                (keys: 'T', 'B', 'L', 'R' for top, bottom, left, right).
+        walls: Bitmask of the walls present on each side
+               (T, R, B, L for top, right, bottom, left).
+        limits: Bitmask of the maze boundaries the cell touches
+                (T, R, B, L for top, right, bottom, left).
         x: Column position of the cell.
         y: Row position of the cell.
         logo: Whether this cell is part of the logo pattern.
         visited: Whether this cell has been visited during maze generation.
+        solution: Whether this cell is drawn as part of the solution path.
     """
 
+    __slots__ = ('walls', 'limits', 'x', 'y', 'logo', 'visited',
+                 'in_path', 'solution')
+
     def __init__(
             self, x: int,
             y: int,
-            limits: Dict[str, bool]
+            limits: int
             ) -> None:
         """Initialize a cell with position and boundary information.
 
         Args:
             x: Column position of the cell.
             y: Row position of the cell.
-            limits: Dictionary indicating if cell is at maze boundaries
-                   (keys: 'T', 'B', 'L', 'R' for top, bottom, left, right).
+            limits: Bitmask of the maze boundaries the cell touches
+                   (T, R, B, L for top, right, bottom, left).
         """
-        self.walls = {'T': True, 'B': True, 'L': True, 'R': True}
+        self.walls = ALL_WALLS
         self.limits = limits
         self.x = x
         self.y = y
@@ -73,6 +128,8 @@ class Cell:
 
         Renders the cell as a 4x3 character block with walls represented by
         block characters. Colors differ for logo cells, entry, and exit.
+        Neighbouring characters sharing a color are written with a single
+        addstr call.
 
         Args:
             stdscr: Curses window object for display.
@@ -81,97 +138,149 @@ class Cell:
             height: Total height of the maze in cells.
             entry: Entry point coordinates (row, column).
             exit: Exit point coordinates (row, column).
+            maze_color: Color pair number of each color role, as in
+                        MazeGenerator.maze_color.
         """
+        self.paint(stdscr, cells, entry, exit, color_attrs(maze_color))
+
+    def paint(
+            self,
+            stdscr: curses.window,
+            cells: List[List["Cell"]],
+            entry: Tuple[int, int],
+            exit: Tuple[int, int],
+            attrs: Dict[str, int]
+            ) -> None:
+        """Write the cell's 4x3 block with already resolved attributes.
+
+        Args:
+            stdscr: Curses window object for display.
+            cells: 2D list of all cells in the maze.
+            entry: Entry point coordinates (row, column).
+            exit: Exit point coordinates (row, column).
+            attrs: curses attribute of each color role, as returned by
+                   color_attrs.
+        """
+        top, middle, bottom = self.rows(cells, entry, exit, attrs)
+        add_runs(stdscr, self.y * 2, self.x * 4, top)
+        add_runs(stdscr, self.y * 2 + 1, self.x * 4, middle)
+        add_runs(stdscr, self.y * 2 + 2, self.x * 4, bottom)
+
+    def rows(
+            self,
+            cells: List[List["Cell"]],
+            entry: Tuple[int, int],
+            exit: Tuple[int, int],
+            attrs: Dict[str, int]
+            ) -> Tuple[Segments, Segments, Segments]:
+        """Compute the three screen rows of the cell's 4x3 block.
+
+        Args:
+            cells: 2D list of all cells in the maze.
+            entry: Entry point coordinates (row, column).
+            exit: Exit point coordinates (row, column).
+            attrs: curses attribute of each color role, as returned by
+                   color_attrs.
 
-        nx = self.x * 4
-        ny = self.y * 2
-
-        stdscr.addstr(ny, nx, "█",
-                      curses.color_pair(maze_color['Walls']))
-        stdscr.addstr(ny, nx + 3, "█",
-                      curses.color_pair(maze_color['Walls']))
-        stdscr.addstr(ny + 2, nx, "█",
-                      curses.color_pair(maze_color['Walls']))
-        stdscr.addstr(ny + 2, nx + 3, "█",
-                      curses.color_pair(maze_color['Walls']))
-
-        if (self.y - 1 >= 0 and cells[self.y - 1][self.x].solution
-                and self.solution and not self.walls['T']):
-            stdscr.addstr(ny, nx + 1, "██",
-                          curses.color_pair(maze_color['Solution']))
-        elif self.walls['T'] and ((self.y - 1 >= 0 and
-                                   cells[self.y - 1][self.x].walls['B'])
-                                  or self.y == 0):
-            stdscr.addstr(ny, nx + 1, "██",
-                          curses.color_pair(maze_color['Walls']))
-        elif self.limits['T']:
-            stdscr.addstr(ny, nx + 1, "██",
-                          curses.color_pair(maze_color['Walls']))
+        Returns:
+            Top, middle and bottom rows as (text, attr) segments.
+        """
+        y = self.y
+        x = self.x
+        walls = self.walls
+        solution = self.solution
+        logo = self.logo
+        wall = attrs['Walls']
+        # Off the solution and outside the special cells, the block only
+        # depends on the cell's own walls (see the wall invariant above T).
+        if not (solution or logo
+                or (y == entry[0] and x == entry[1])
+                or (y == exit[0] and x == exit[1])):
+            top_row, middle_row, bottom_row = WALL_ROWS[walls]
+            return (((top_row, wall),), ((middle_row, wall),),
+                    ((bottom_row, wall),))
+        path = attrs['Solution']
+
+        # No bounds check on the neighbour reads: see wall invariant.
+        if solution and not walls & T and cells[y - 1][x].solution:
+            top = ("██", path)
         else:
-            stdscr.addstr(ny, nx + 1, "  ",
-                          curses.color_pair(maze_color['Walls']))
-
-        if (self.y + 1 < height and cells[self.y + 1][self.x].solution
-                and self.solution and not self.walls['B']):
-            stdscr.addstr(ny + 2, nx + 1, "██",
-                          curses.color_pair(maze_color['Solution']))
-        elif self.walls['B']:
-            stdscr.addstr(ny + 2, nx + 1, "██",
-                          curses.color_pair(maze_color['Walls']))
-        elif self.limits['B']:
-            stdscr.addstr(ny + 2, nx + 1, "██",
-                          curses.color_pair(maze_color['Walls']))
+            top = ("██" if walls & T else "  ", wall)
+
+        if solution and not walls & B and cells[y + 1][x].solution:
+            bottom = ("██", path)
         else:
-            stdscr.addstr(ny + 2, nx + 1, "  ",
-                          curses.color_pair(maze_color['Walls']))
-
-        if (self.x - 1 >= 0 and cells[self.y][self.x - 1].solution
-                and self.solution and not self.walls['L']):
-            stdscr.addstr(ny + 1, nx, "█",
-                          curses.color_pair(maze_color['Solution']))
-        elif self.walls['L'] and ((self.x - 1 >= 0 and
-                                   cells[self.y][self.x - 1].walls['R']) or
-                                  self.x == 0):
-            stdscr.addstr(ny + 1, nx, "█",
-                          curses.color_pair(maze_color['Walls']))
-        elif self.limits['L']:
-            stdscr.addstr(ny + 1, nx, "█",
-                          curses.color_pair(maze_color['Walls']))
+            bottom = ("██" if walls & B else "  ", wall)
+
+        if solution and not walls & L and cells[y][x - 1].solution:
+            left = ("█", path)
         else:
-            stdscr.addstr(ny + 1, nx, " ",
-                          curses.color_pair(maze_color['Walls']))
-
-        if (self.x + 1 < width and cells[self.y][self.x + 1].solution
-                and self.solution and not self.walls['R']):
-            stdscr.addstr(ny + 1, nx + 3, "█",
-                          curses.color_pair(maze_color['Solution']))
-        elif self.walls['R'] and ((self.x + 1 < width and
-                                   cells[self.y][self.x + 1].walls['L']) or
-                                  self.x == width - 1):
-            stdscr.addstr(ny + 1, nx + 3, "█",
-                          curses.color_pair(maze_color['Walls']))
-        elif self.limits['R']:
-            stdscr.addstr(ny + 1, nx + 3, "█",
-                          curses.color_pair(maze_color['Walls']))
+            left = ("█" if walls & L else " ", wall)
+
+        if solution and not walls & R and cells[y][x + 1].solution:
+            right = ("█", path)
         else:
-            stdscr.addstr(ny + 1, nx + 3, " ",
-                          curses.color_pair(maze_color['Walls']))
-
-        if self.logo:
-            stdscr.addstr(ny + 1, nx + 1, "██",
-                          curses.color_pair(maze_color['Logo']))
-        elif self.x == entry[1] and self.y == entry[0]:
-            stdscr.addstr(ny + 1, nx + 1, "██",
-                          curses.color_pair(maze_color['Entry']))
-        elif self.x == exit[1] and self.y == exit[0]:
-            stdscr.addstr(ny + 1, nx + 1, "██",
-                          curses.color_pair(maze_color['Exit']))
-        elif self.solution:
-            stdscr.addstr(ny + 1, nx + 1, "██",
-                          curses.color_pair(maze_color['Solution']))
+            right = ("█" if walls & R else " ", wall)
+
+        if logo:
+            center = ("██", attrs['Logo'])
+        elif x == entry[1] and y == entry[0]:
+            center = ("██", attrs['Entry'])
+        elif x == exit[1] and y == exit[0]:
+            center = ("██", attrs['Exit'])
+        elif solution:
+            center = ("██", path)
         else:
-            stdscr.addstr(ny + 1, nx + 1, "  ",
-                          curses.color_pair(maze_color['Walls']))
+            center = ("  ", wall)
+
+        corner = ("█", wall)
+        return ((corner, top, corner), (left, center, right),
+                (corner, bottom, corner))
+
+
+def color_attrs(maze_color: Dict[str, int]) -> Dict[str, int]:
+    """Resolve a color scheme into curses attributes.
+
+    curses.color_pair is called once per role here instead of once per
+    character written, and the result can be shared by every cell drawn
+    in the same frame.
+
+    Args:
+        maze_color: Color pair number of each color role.
+
+    Returns:
+        Dict mapping each role of maze_color to its curses attribute.
+    """
+    return {role: curses.color_pair(pair)
+            for role, pair in maze_color.items()}
+
+
+def add_runs(
+        stdscr: curses.window,
+        y: int,
+        x: int,
+        segments: Segments
+        ) -> None:
+    """Write consecutive (text, attr) segments, one addstr per color run.
+
+    Args:
+        stdscr: Curses window object for display.
+        y: Screen row.
+        x: Screen column of the first segment.
+        segments: Texts to write side by side with their curses attribute.
+    """
+    addstr = stdscr.addstr
+    parts: List[str] = []
+    attr = segments[0][1]
+    for seg_text, seg_attr in segments:
+        if seg_attr != attr:
+            text = "".join(parts)
+            addstr(y, x, text, attr)
+            x += len(text)
+            parts = []
+            attr = seg_attr
+        parts.append(seg_text)
+    addstr(y, x, "".join(parts), attr)
 
 
 class MazeGenerator:
@@ -185,6 +294,20 @@ class MazeGenerator:
         visited_count: Number of cells visited during generation.
         cells_count: Total number of cells in the maze.
         cells: 2D list of Cell objects representing the maze grid.
+        flat_cells: Read-only view of the same Cell objects in one list,
+                    indexed by y * width + x. It is built once and not
+                    kept in sync, so cells must be changed in place and
+                    never replaced in either list.
+        rng: Random generator used by the generation algorithms.
+        step_time: Seconds given to each step of the current animation.
+        animation_start: time.monotonic() at which the current animation
+                         started.
+        animation_steps: Number of steps taken in the current animation.
+        last_frame: Scheduled time of the last frame pushed to the
+                    terminal.
+
+        The four pacing attributes are internal state of start_animation
+        and frame_due, reset before every animated loop.
 
         """
 
@@ -195,7 +318,8 @@ class MazeGenerator:
             entry: Tuple[int, int],
             exit: Tuple[int, int],
             perfect: bool,
-            maze_color: Dict[str, int] | None = None
+            maze_color: Dict[str, int] | None = None,
+            seed: int | None = None
             ) -> None:
         """Initialize a maze with given dimensions.
 
@@ -208,6 +332,12 @@ class MazeGenerator:
             maze_color: Dict containing the colors needed for drawing the maze
                         Example : {'Walls': 1, 'Logo': 2, 'Solution': 6,
                                'Entry': 3, 'Exit': 5}
+            seed: Seed of the maze's own random generator. The same seed
+                  always carves the same maze; None picks a random one.
+
+        Raises:
+            ValueError: If the maze is too small for the 42 logo, or the
+                        entry or exit falls on a logo cell.
         """
         self.width = width
         self.height = height
@@ -215,7 +345,12 @@ class MazeGenerator:
         self.exit = exit
         self.visited_count = 0
         self.perfect = perfect
+        self.rng = random.Random(seed)
         self.cells_count = width * height
+        self.step_time = STEP_TIME
+        self.animation_start = 0.0
+        self.animation_steps = 0
+        self.last_frame = 0.0
         if maze_color is None:
             self.maze_color = {'Walls': 1, 'Logo': 2, 'Solution': 6,
                                'Entry': 3, 'Exit': 5}
@@ -226,41 +361,33 @@ class MazeGenerator:
                     Cell(
                         x,
                         y,
-                        {
-                            'T': (y == 0),
-                            'B': (y == height - 1),
-                            'L': (x == 0),
-                            'R': (x == width - 1),
-                            }
+                        (T if y == 0 else 0)
+                        | (B if y == height - 1 else 0)
+                        | (L if x == 0 else 0)
+                        | (R if x == width - 1 else 0)
                         )
                     for x in range(width)
                     ]
                 for y in range(height)
                 ]
+        self.flat_cells = [cell for row in self.cells for cell in row]
         self.generate_maze()
         if width >= 9 and height >= 7:
             self.declare_logo()
         else:
             raise ValueError("Maze width and height isnt enough"
                              "to show 42 logo")
+        if self.cells[exit[0]][exit[1]].logo:
+            raise ValueError(f"Exit {tuple(exit)} is on a logo cell")
+        if self.cells[entry[0]][entry[1]].logo:
+            raise ValueError(f"Entry {tuple(entry)} is on a logo cell")
 
     def generate_maze(self) -> None:
-        """Generate the initial maze grid with all walls intact.
+        """Prepare the freshly built grid for generation.
 
-        Creates a grid of Cell objects with appropriate boundary information
-        and marks the entry cell as visited.
+        The Cell objects are already created with all walls intact by
+        __init__, so this only marks the entry cell as visited.
         """
-        x = 0
-        y = 0
-        for y in range(self.height):
-            for x in range(self.width):
-                limits = {
-                    'T': (y == 0),
-                    'B': (y == self.height - 1),
-                    'L': (x == 0),
-                    'R': (x == self.width - 1)
-                }
-                self.cells[y][x] = Cell(x, y, limits)
         self.cells[self.entry[0]][self.entry[1]].visited = True
         self.visited_count += 1
 
@@ -277,19 +404,33 @@ class MazeGenerator:
             path_color: color of the path.
             show: boolean variable to hide the solution
         """
+        # A path edge is drawn only between two solution cells, so a step
+        # changes the blocks of the cell and of its neighbours, never the
+        # rest of the maze.
+        cells = self.cells
+        height = self.height
+        width = self.width
         if show:
+            self.start_animation(len(path))
+            pending: List[Tuple[int, int]] = []
             for place in path:
                 nx = place[1]
                 ny = place[0]
-                self.cells[ny][nx].solution = True
-                self.display(stdscr)
-                time.sleep(0.01)
+                cells[ny][nx].solution = True
+                pending.append((ny, nx))
+                for dy, dx, _ in DIRECTIONS:
+                    if 0 <= ny + dy < height and 0 <= nx + dx < width:
+                        pending.append((ny + dy, nx + dx))
+                if self.frame_due():
+                    self.draw_cells(stdscr, pending)
+                    pending = []
+            self.draw_cells(stdscr, pending)
         else:
             for place in path:
                 nx = place[1]
                 ny = place[0]
-                self.cells[ny][nx].solution = False
-            self.display(stdscr)
+                cells[ny][nx].solution = False
+            self.draw_cells(stdscr, path)
 
     def bfs_solver(
             self,
@@ -297,6 +438,11 @@ class MazeGenerator:
             end: Tuple[int, int]
             ) -> Optional[List[Tuple[int, int]]]:
         """Solve maze using BFS.
+
+        The search grows one level at a time from both ends, always from
+        the smaller frontier, and stops at the level where the two sides
+        meet, so it explores about half as deep as a single-ended BFS.
+
         Args:
             start: Start position (row, column).
             end: End position (row, column).
@@ -304,34 +450,63 @@ class MazeGenerator:
         Returns:
             List of coordinates forming the path, or None.
         """
-        for row in self.cells:
-            for cell in row:
-                cell.visited = False
-        child: List[Tuple[int, int]] = [entry]
-        parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {
-                entry: None
-                }
-        self.cells[entry[0]][entry[1]].visited = True
-
-        while child:
-            curr = child.pop(0)
-            y, x = curr
-            if curr == end:
-                path: List[Tuple[int, int]] = []
-                node: Optional[Tuple[int, int]] = end
-                while node is not None:
-                    path.append(node)
-                    node = parent[node]
-                path.reverse()
-
-                return path
-            neighbors = self.get_neighbors(y, x)
-
-            for ny, nx in neighbors:
-                if not self.cells[ny][nx].visited:
-                    self.cells[ny][nx].visited = True
-                    parent[(ny, nx)] = curr
-                    child.append((ny, nx))
+        # Cells are tracked by their flat id y * width + x. Side 0 searches
+        # from the entry and side 1 from the end; dist[side][cell] is -1
+        # until that side reaches the cell. The search keeps its own state,
+        # leaving Cell.visited to the generators.
+        width = self.width
+        start = entry[0] * width + entry[1]
+        goal = end[0] * width + end[1]
+        if start == goal:
+            return [divmod(start, width)]
+        flat_cells = self.flat_cells
+        dist = ([-1] * self.cells_count, [-1] * self.cells_count)
+        parent = ([-1] * self.cells_count, [-1] * self.cells_count)
+        dist[0][start] = 0
+        dist[1][goal] = 0
+        frontiers = [[start], [goal]]
+
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            own_dist = dist[side]
+            other_dist = dist[1 - side]
+            own_parent = parent[side]
+            best = -1
+            meet = (-1, -1)
+            level: List[int] = []
+            for curr in frontiers[side]:
+                walls = flat_cells[curr].walls
+                for dy, dx, wall in DIRECTIONS:
+                    if walls & wall:
+                        continue
+                    node = curr + dy * width + dx
+                    # Every meeting found on this level is compared, since
+                    # the first one is not always the shortest.
+                    if other_dist[node] != -1:
+                        length = own_dist[curr] + 1 + other_dist[node]
+                        if best == -1 or length < best:
+                            best = length
+                            meet = (curr, node)
+                    if own_dist[node] == -1:
+                        own_dist[node] = own_dist[curr] + 1
+                        own_parent[node] = curr
+                        level.append(node)
+            if best != -1:
+                # Walk each half back to its own root, then join them so
+                # the path runs from entry to end.
+                halves: List[List[Tuple[int, int]]] = []
+                for half_side, node in ((side, meet[0]),
+                                        (1 - side, meet[1])):
+                    half: List[Tuple[int, int]] = []
+                    while node != -1:
+                        half.append(divmod(node, width))
+                        node = parent[half_side][node]
+                    halves.append(half)
+                if side == 1:
+                    halves.reverse()
+                halves[0].reverse()
+                return halves[0] + halves[1]
+            frontiers[side] = level
         return None
 
     def get_neighbors(
@@ -349,21 +524,10 @@ class MazeGenerator:
             List of (row, col) tuples for reachable neighbors.
 
         """
-        neighbors = []
-
-        if not self.cells[y][x].walls['R'] and x + 1 < self.width:
-            neighbors.append((y, x + 1))
-
-        if not self.cells[y][x].walls['B'] and y + 1 < self.height:
-            neighbors.append((y + 1, x))
-
-        if not self.cells[y][x].walls['L'] and x - 1 >= 0:
-            neighbors.append((y, x - 1))
-
-        if not self.cells[y][x].walls['T'] and y - 1 >= 0:
-            neighbors.append((y - 1, x))
-
-        return neighbors
+        # No bounds check: see wall invariant.
+        walls = self.cells[y][x].walls
+        return [(y + dy, x + dx) for dy, dx, side in DIRECTIONS
+                if not walls & side]
 
     def declare_logo(self) -> None:
         """Mark specific 42 in the center of the maze as logo cells.
@@ -371,30 +535,14 @@ class MazeGenerator:
         Creates a 42 pattern in the center of the maze by marking specific
         cells. These cells will be excluded from the maze generation algorithm.
         """
-        center_width = math.floor(self.width / 2)
-        center_height = math.floor(self.height / 2)
+        center_width = self.width // 2
+        center_height = self.height // 2
 
         x = center_width - 3
         y = center_height - 2
 
-        self.cells[y][x].logo = True
-        self.cells[y + 1][x].logo = True
-        self.cells[y + 2][x].logo = True
-        self.cells[y + 2][x + 1].logo = True
-        self.cells[y + 2][x + 2].logo = True
-        self.cells[y + 3][x + 2].logo = True
-        self.cells[y + 4][x + 2].logo = True
-        self.cells[y + 4][x + 4].logo = True
-        self.cells[y + 4][x + 5].logo = True
-        self.cells[y + 4][x + 6].logo = True
-        self.cells[y + 3][x + 4].logo = True
-        self.cells[y + 2][x + 4].logo = True
-        self.cells[y + 2][x + 5].logo = True
-        self.cells[y + 2][x + 6].logo = True
-        self.cells[y + 1][x + 6].logo = True
-        self.cells[y][x + 6].logo = True
-        self.cells[y][x + 5].logo = True
-        self.cells[y][x + 4].logo = True
+        for dy, dx in LOGO_OFFSETS:
+            self.cells[y + dy][x + dx].logo = True
 
     def dfs_algo(
             self,
@@ -403,66 +551,58 @@ class MazeGenerator:
             x: int) -> None:
         """Generate maze paths using depth-first search algorithm.
 
-        Iterativly visits unvisited neighboring cells, removing walls between
-        them to create maze passages. The algorithm avoids logo cells and
+        Iteratively visits unvisited neighboring cells, removing walls between
+        them to create maze passages. The path is kept on an explicit stack
+        instead of the call stack, so backtracking never hits Python's
+        recursion limit on large mazes. The algorithm avoids logo cells and
         visualizes the generation process.
 
         Args:
             stdscr: Curses window object for display.
-            y: Current row position.
-            x: Current column position.
+            y: Starting row position.
+            x: Starting column position.
         """
 
         stack: List[Tuple[int, int]] = [(y, x)]
+        pending: List[Tuple[int, int]] = []
+        self.display(stdscr)
+        self.start_animation(self.cells_count)
+        cells = self.cells
+        randrange = self.rng.randrange
+        orders = len(DIRECTION_ORDERS)
+        carved = 0
 
         while stack:
             cy, cx = stack[-1]
-
-            choices = []
-            if (cx + 1 < self.width
-                    and not self.cells[cy][cx + 1].visited
-                    and not self.cells[cy][cx + 1].logo):
-                choices.append((cy, cx + 1))
-            if (cy + 1 < self.height
-                    and not self.cells[cy + 1][cx].visited
-                    and not self.cells[cy + 1][cx].logo):
-                choices.append((cy + 1, cx))
-            if (cy - 1 >= 0
-                    and not self.cells[cy - 1][cx].visited
-                    and not self.cells[cy - 1][cx].logo):
-                choices.append((cy - 1, cx))
-            if (cx - 1 >= 0
-                    and not self.cells[cy][cx - 1].visited
-                    and not self.cells[cy][cx - 1].logo):
-                choices.append((cy, cx - 1))
-
-            if not choices:
+            cell = cells[cy][cx]
+
+            # The first free neighbour in a random order is a uniform pick
+            # among the free neighbours.
+            limits = cell.limits
+            for dy, dx, side in DIRECTION_ORDERS[randrange(orders)]:
+                if limits & side:
+                    continue
+                ny = cy + dy
+                nx = cx + dx
+                neighbour = cells[ny][nx]
+                if not neighbour.visited and not neighbour.logo:
+                    break
+            else:
                 stack.pop()
                 continue
 
-            random.shuffle(choices)
-            ny, nx = choices[0]
-
-            if ny - cy > 0:
-                self.cells[ny][nx].walls["T"] = False
-                self.cells[cy][cx].walls["B"] = False
-            elif ny - cy < 0:
-                self.cells[ny][nx].walls["B"] = False
-                self.cells[cy][cx].walls["T"] = False
-            elif nx - cx > 0:
-                self.cells[ny][nx].walls["L"] = False
-                self.cells[cy][cx].walls["R"] = False
-            elif nx - cx < 0:
-                self.cells[ny][nx].walls["R"] = False
-                self.cells[cy][cx].walls["L"] = False
-
-            self.cells[ny][nx].visited = True
-            self.visited_count += 1
-            self.display(stdscr)
-            stdscr.refresh()
-            time.sleep(0.01)
+            cell.walls &= ~side
+            neighbour.walls &= ~OPPOSITE[side]
+            neighbour.visited = True
+            carved += 1
+            pending += [(cy, cx), (ny, nx)]
+            if self.frame_due():
+                self.draw_cells(stdscr, pending)
+                pending = []
 
             stack.append((ny, nx))
+        self.visited_count += carved
+        self.draw_cells(stdscr, pending)
 
     def dfs(
         self,
@@ -472,14 +612,13 @@ class MazeGenerator:
 
         """Generate maze paths using depth-first search algorithm.
 
-        Recursively visits unvisited neighboring cells, removing walls between
-        them to create maze passages. The algorithm avoids logo cells and
-        visualizes the generation process.
+        Carves the maze with the iterative backtracker in dfs_algo, then
+        opens extra walls when the maze is not perfect.
 
         Args:
             stdscr: Curses window object for display.
-            y: Current row position.
-            x: Current column position.
+            y: Starting row position.
+            x: Starting column position.
         """
 
         self.dfs_algo(stdscr, y, x)
@@ -499,48 +638,118 @@ class MazeGenerator:
             x: Starting column position.
 
         """
-        choices = set()
+        frontier: List[Tuple[int, int]] = []
+        in_frontier: Set[Tuple[int, int]] = set()
+        pending: List[Tuple[int, int]] = []
+        self.display(stdscr)
+        self.start_animation(self.cells_count)
+        cells = self.cells
+        randrange = self.rng.randrange
         while self.visited_count < self.cells_count:
-            if (x + 1 < self.width and not self.cells[y][x + 1].visited
-                    and not self.cells[y][x + 1].logo):
-                choices.add((y, x + 1))
-            if (y + 1 < self.height and not self.cells[y + 1][x].visited
-                    and not self.cells[y + 1][x].logo):
-                choices.add((y + 1, x))
-            if (y - 1 >= 0 and not self.cells[y - 1][x].visited
-                    and not self.cells[y - 1][x].logo):
-                choices.add((y - 1, x))
-            if (x - 1 >= 0 and not self.cells[y][x - 1].visited
-                    and not self.cells[y][x - 1].logo):
-                choices.add((y, x - 1))
-
-            if choices:
-                selection = random.choice(list(choices))
-                ny, nx = selection
-                choices.remove(selection)
-
-                if ny - 1 >= 0 and self.cells[ny - 1][nx].visited:
-                    self.cells[ny][nx].walls["T"] = False
-                    self.cells[ny - 1][nx].walls["B"] = False
-                elif nx - 1 >= 0 and self.cells[ny][nx - 1].visited:
-                    self.cells[ny][nx].walls["L"] = False
-                    self.cells[ny][nx - 1].walls["R"] = False
-                elif nx + 1 < self.width and self.cells[ny][nx + 1].visited:
-                    self.cells[ny][nx].walls["R"] = False
-                    self.cells[ny][nx + 1].walls["L"] = False
-                elif ny + 1 < self.height and self.cells[ny + 1][nx].visited:
-                    self.cells[ny][nx].walls["B"] = False
-                    self.cells[ny + 1][nx].walls["T"] = False
-
-                self.cells[ny][nx].visited = True
-                self.visited_count += 1
-                stdscr.refresh()
-                self.display(stdscr)
-                x = nx
-                y = ny
-                time.sleep(0.01)
-            else:
+            limits = cells[y][x].limits
+            for dy, dx, side in DIRECTIONS:
+                if limits & side:
+                    continue
+                cell = cells[y + dy][x + dx]
+                if cell.visited or cell.logo:
+                    continue
+                candidate = (y + dy, x + dx)
+                if candidate not in in_frontier:
+                    in_frontier.add(candidate)
+                    frontier.append(candidate)
+
+            if not frontier:
                 break
+            # Swap the picked cell with the last one so removal is O(1).
+            i = randrange(len(frontier))
+            selection = frontier[i]
+            frontier[i] = frontier[-1]
+            frontier.pop()
+            in_frontier.remove(selection)
+            ny, nx = selection
+            cell = cells[ny][nx]
+
+            # Join the new cell to the first visited neighbour found.
+            py, px = ny, nx
+            limits = cell.limits
+            for dy, dx, side in JOIN_ORDER:
+                if not limits & side and cells[ny + dy][nx + dx].visited:
+                    py = ny + dy
+                    px = nx + dx
+                    cell.walls &= ~side
+                    cells[py][px].walls &= ~OPPOSITE[side]
+                    break
+
+            cell.visited = True
+            self.visited_count += 1
+            pending += [(py, px), (ny, nx)]
+            if self.frame_due():
+                self.draw_cells(stdscr, pending)
+                pending = []
+            x = nx
+            y = ny
+        self.draw_cells(stdscr, pending)
+        if not self.perfect:
+            self.make_it_imperfect(stdscr)
+
+    def kruskal(
+            self,
+            stdscr: curses.window) -> None:
+        """Generate a maze using Kruskal's algorithm.
+
+        Every wall between two non-logo cells is shuffled once, then walls
+        are removed in that order whenever the cells on both sides are not
+        yet connected. Connected cells are tracked with a union-find over
+        flat cell ids, so the whole carve is close to linear in the number
+        of walls.
+
+        Args:
+            stdscr: Curses window object for display.
+        """
+        cells = self.cells
+        width = self.width
+        # (cell id, neighbour id, wall crossed) for every inner wall.
+        edges: List[Tuple[int, int, int]] = []
+        for y, row in enumerate(cells):
+            for x, cell in enumerate(row):
+                if cell.logo:
+                    continue
+                node = y * width + x
+                if x + 1 < width and not row[x + 1].logo:
+                    edges.append((node, node + 1, R))
+                if y + 1 < self.height and not cells[y + 1][x].logo:
+                    edges.append((node, node + width, B))
+        self.rng.shuffle(edges)
+
+        flat_cells = self.flat_cells
+        parent = list(range(self.cells_count))
+        pending: List[Tuple[int, int]] = []
+        self.display(stdscr)
+        self.start_animation(self.cells_count)
+        for a, b, side in edges:
+            root_a = a
+            while parent[root_a] != root_a:
+                parent[root_a] = parent[parent[root_a]]
+                root_a = parent[root_a]
+            root_b = b
+            while parent[root_b] != root_b:
+                parent[root_b] = parent[parent[root_b]]
+                root_b = parent[root_b]
+            if root_a == root_b:
+                continue
+            parent[root_a] = root_b
+
+            flat_cells[a].walls &= ~side
+            flat_cells[b].walls &= ~OPPOSITE[side]
+            for cell in (flat_cells[a], flat_cells[b]):
+                if not cell.visited:
+                    cell.visited = True
+                    self.visited_count += 1
+            pending += [divmod(a, width), divmod(b, width)]
+            if self.frame_due():
+                self.draw_cells(stdscr, pending)
+                pending = []
+        self.draw_cells(stdscr, pending)
         if not self.perfect:
             self.make_it_imperfect(stdscr)
 
@@ -549,58 +758,154 @@ class MazeGenerator:
             stdscr: curses.window) -> None:
         """Remove extra walls to create an imperfect maze (multiple paths).
 
+        Only interior cells can qualify, so the scan skips the border
+        instead of bounds-checking every cell. Each decision looks at walls
+        opened earlier in the same scan, so cells are still visited in
+        order; the opened cells are repainted together at the end.
+
         Args:
             stdscr: Curses window object for display.
         """
-        for y in range(self.height):
-            for x in range(self.width):
-                if (x + 1 < self.width and x - 1 >= 0
-                    and y + 1 < self.height and y - 1 >= 0
-                    and not self.cells[y][x].logo
-                    and not self.cells[y][x + 1].logo
-                    and not self.cells[y][x - 1].logo
-                    and not self.cells[y + 1][x].logo
-                        and not self.cells[y - 1][x].logo):
-                    if (self.cells[y][x].walls['T']
-                        and ((self.cells[y][x + 1].walls['T']
-                              or self.cells[y - 1][x + 1].walls['L'])
-                        and (self.cells[y][x - 1].walls['T']
-                             or self.cells[y - 1][x - 1].walls['R']))):
-                        self.cells[y][x].walls['T'] = False
-                        self.cells[y - 1][x].walls['B'] = False
-
-                    if (self.cells[y][x].walls['L']
-                        and ((self.cells[y + 1][x].walls['L']
-                              or self.cells[y + 1][x - 1].walls['T'])
-                        and (self.cells[y - 1][x].walls['L']
-                             or self.cells[y - 1][x - 1].walls['B']))):
-                        self.cells[y][x].walls['L'] = False
-                        self.cells[y][x - 1].walls['R'] = False
-
-                    self.display(stdscr)
+        # Cells on the logo or next to it are never opened.
+        near_logo = {(y + dy, x + dx)
+                     for y, row in enumerate(self.cells)
+                     for x, cell in enumerate(row) if cell.logo
+                     for dy, dx in ((0, 0), (0, 1), (1, 0), (0, -1), (-1, 0))}
+        opened: List[Tuple[int, int]] = []
+        for y in range(1, self.height - 1):
+            above = self.cells[y - 1]
+            row = self.cells[y]
+            below = self.cells[y + 1]
+            for x in range(1, self.width - 1):
+                if (y, x) in near_logo:
+                    continue
+                if (row[x].walls & T
+                        and (row[x + 1].walls & T or above[x + 1].walls & L)
+                        and (row[x - 1].walls & T
+                             or above[x - 1].walls & R)):
+                    row[x].walls &= ~T
+                    above[x].walls &= ~B
+                    opened += [(y - 1, x), (y, x)]
+
+                if (row[x].walls & L
+                        and (below[x].walls & L or below[x - 1].walls & T)
+                        and (above[x].walls & L
+                             or above[x - 1].walls & B)):
+                    row[x].walls &= ~L
+                    row[x - 1].walls &= ~R
+                    opened += [(y, x - 1), (y, x)]
+        self.draw_cells(stdscr, opened)
+
+    def start_animation(self, steps: int) -> None:
+        """Reset the animation clock before an animated loop.
+
+        Args:
+            steps: Expected number of animated steps, used to shorten the
+                   per-step time so that big mazes still finish within
+                   ANIMATION_TIME.
+        """
+        self.step_time = min(STEP_TIME, ANIMATION_TIME / max(steps, 1))
+        self.animation_start = time.monotonic()
+        self.animation_steps = 0
+        self.last_frame = self.animation_start
+
+    def frame_due(self) -> bool:
+        """Advance the animation by one step and tell if a frame is due.
+
+        Steps are scheduled every step_time seconds. Steps are batched until
+        a full FRAME_TIME of animation has built up; the caller then pushes
+        one frame, after sleeping only if the loop runs ahead of schedule.
+
+        Returns:
+            True when the caller should draw its pending changes.
+        """
+        self.animation_steps += 1
+        due = self.animation_start + self.animation_steps * self.step_time
+        if due - self.last_frame < FRAME_TIME:
+            return False
+        ahead = due - time.monotonic()
+        if ahead > 0:
+            time.sleep(ahead)
+        self.last_frame = due
+        return True
+
+    def color_attrs(self) -> Dict[str, int]:
+        """Resolve the current color scheme into curses attributes.
+
+        Returns:
+            Dict mapping each role of maze_color to its curses attribute.
+        """
+        return color_attrs(self.maze_color)
 
     def display(
             self,
             stdscr: curses.window) -> None:
         """Display the current state of the maze.
 
-        Clears the screen and redraws all cells in the maze with their
-        current wall configuration and colors.
+        Redraws all cells in the maze with their current wall configuration
+        and colors, one addstr per color run of each screen row. Used for
+        the first frame and after a color change; the generators only
+        repaint the cells they touch through draw_cells.
 
         Args:
             stdscr: Curses window object for display.
         """
 
-        for row in self.cells:
+        for y, segments in self.render_rows():
+            add_runs(stdscr, y, 0, segments)
+
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+    def render_rows(self) -> List[Tuple[int, Segments]]:
+        """Lay out the whole maze as screen rows.
+
+        Cells share their top and bottom screen rows with the cells above
+        and below, so row 2*y holds the top edge of grid row y and the last
+        screen row holds the bottom edge of the last grid row.
+
+        Returns:
+            List of (screen row, segments) covering the full maze.
+        """
+        attrs = self.color_attrs()
+        cells = self.cells
+        entry = self.entry
+        exit = self.exit
+        rendered: List[Tuple[int, Segments]] = []
+        bottoms: List[Tuple[str, int]] = []
+        for y, row in enumerate(cells):
+            tops: List[Tuple[str, int]] = []
+            middles: List[Tuple[str, int]] = []
+            bottoms = []
             for cell in row:
-                cell.draw(
-                        stdscr,
-                        self.cells,
-                        self.width,
-                        self.height,
-                        self.entry,
-                        self.exit,
-                        self.maze_color
-                        )
+                top, middle, bottom = cell.rows(cells, entry, exit, attrs)
+                tops.extend(top)
+                middles.extend(middle)
+                bottoms.extend(bottom)
+            rendered.append((y * 2, tops))
+            rendered.append((y * 2 + 1, middles))
+        rendered.append((self.height * 2, bottoms))
+        return rendered
+
+    def draw_cells(
+            self,
+            stdscr: curses.window,
+            positions: List[Tuple[int, int]]) -> None:
+        """Repaint only the given cells and push the change to the terminal.
+
+        A carved wall is drawn entirely inside the blocks of the two cells
+        it separates, so redrawing both ends of the carve is enough to keep
+        the screen in sync without a full display().
 
-        stdscr.refresh()
+        Args:
+            stdscr: Curses window object for display.
+            positions: (row, column) of every cell to repaint.
+        """
+        # Cell.draw resolves the color pairs on every call, so the cells are
+        # painted here with the attributes resolved once for the frame.
+        attrs = self.color_attrs()
+        cells = self.cells
+        for y, x in positions:
+            cells[y][x].paint(stdscr, cells, self.entry, self.exit, attrs)
+        stdscr.noutrefresh()
+        curses.doupdate()
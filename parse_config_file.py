@@ -1,5 +1,7 @@
 from typing import Dict, Any
 
+BOOLEANS = {"True": True, "False": False}
+
 
 def parse_config(filename: str) -> Dict[str, Any]:
     """ Parse your config file
@@ -17,19 +19,19 @@ def parse_config(filename: str) -> Dict[str, Any]:
     config = {}
 
     with open(filename, "r") as file:
-        for line in file:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line or line.count("=") != 1:
-                raise ValueError(f"Invalid line: {line}")
-            key, value = line.split("=")
-            if " " in key or "\t" in key:
-                raise ValueError("Key cannot contain spaces")
-            if " " in value or "\t" in value:
-                raise ValueError("Value cannot contain spaces")
+        lines = file.read().splitlines()
+    for line in map(str.strip, lines):
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        if not sep or "=" in value:
+            raise ValueError(f"Invalid line: {line}")
+        if " " in key or "\t" in key:
+            raise ValueError("Key cannot contain spaces")
+        if " " in value or "\t" in value:
+            raise ValueError("Value cannot contain spaces")
 
-            config[key.strip()] = value.strip()
+        config[key.strip()] = value.strip()
     required = [
         "WIDTH",
         "HEIGHT",
@@ -46,35 +48,24 @@ def parse_config(filename: str) -> Dict[str, Any]:
     height = int(config["HEIGHT"])
     entry_x, entry_y = map(int, config["ENTRY"].split(","))
     exit_x, exit_y = map(int, config["EXIT"].split(","))
-    perfect: str | bool = config["PERFECT"]
+    perfect = BOOLEANS.get(config["PERFECT"])
     output_file = config["OUTPUT_FILE"]
     tmp_file = output_file.split(".", 1)
     if (len(tmp_file) != 2 or tmp_file[1] != "txt"):
         raise ValueError("OUT_PUT file must be txt extention.")
 
-    if "ALGO" not in config.keys():
-        algo = "DFS"
-    else:
-        algo = config["ALGO"]
-    if "SEED" not in config.keys():
+    algo = config.get("ALGO", "DFS")
+    try:
+        seed = int(config["SEED"]) if "SEED" in config else None
+    except Exception:
         seed = None
-    else:
-        try:
-            seed = int(config["SEED"])
-        except Exception:
-            seed = None
     if width <= 0 or height <= 0:
         raise ValueError("WIDTH and HEIGHT must be positive greater then 0.")
     if not (0 <= entry_x < width and 0 <= entry_y < height):
         raise ValueError("ENTRY out of bounds")
     if not (0 <= exit_x < width and 0 <= exit_y < height):
         raise ValueError("EXIT out of bounds")
-    if perfect in ['True', 'False']:
-        if perfect == 'True':
-            perfect = True
-        else:
-            perfect = False
-    else:
+    if perfect is None:
         raise ValueError("Perfect should be True or False.")
 
     if entry_x == exit_x and entry_y == exit_y: